@@ -0,0 +1,32 @@
+"""Payload assembly for the /jobs listing hot path.
+
+Kept in its own fully annotated module so it can be AOT-compiled with
+mypyc at build time (`mypyc controllers/_jobs_payload.py`); the emitted
+extension shadows this file on import, so no caller changes are needed
+and the plain-Python version keeps working where it isn't built (PyPy).
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+def build_listing(
+    rows: Sequence[Mapping[str, Any]],
+    page_size: int,
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Build (job_list, next_cursor) from listing row mappings.
+
+    next_cursor points past the last row of a full page; partial pages end
+    the cursor chain. A null after_posting_date marks a cursor inside the
+    NULL-dated tail of the listing — clients resend after_id alone.
+    """
+    job_list: List[Dict[str, Any]] = [dict(row) for row in rows]
+
+    next_cursor: Optional[Dict[str, Any]] = None
+    if len(rows) == page_size:
+        last: Mapping[str, Any] = rows[-1]
+        next_cursor = {
+            "after_posting_date": last["posting_date"],
+            "after_id": last["id"],
+        }
+
+    return job_list, next_cursor
@@ -1,8 +1,83 @@
 from datetime import datetime
-from flask import jsonify, request
 
-from models import Job
+try:
+    import orjson
+except ImportError:  # PyPy build runs on stdlib json (no orjson wheels)
+    orjson = None
+import json
+import threading
+
+from cachetools import TTLCache
+from flask import Response, jsonify, request, stream_with_context
+from sqlalchemy import and_, func, insert, or_, select, text, tuple_
+from sqlalchemy.exc import DataError, IntegrityError
+
+from models import TAG_MAX_LENGTH, Job, JobTag, parse_datetime, split_tags
 from database import db
+from controllers._jobs_payload import build_listing
+
+# Columns serialized by the /jobs listing, in response order
+JOB_LIST_COLUMNS = (Job.id, Job.title, Job.company, Job.location,
+                    Job.posting_date, Job.posting_date_raw, Job.job_type, Job.tags)
+
+# O(1) membership check for job_type validation, built once at import
+ALLOWED_TYPES = frozenset(Job.VALID_JOB_TYPES)
+
+# Per-process cache for single-job reads; writes invalidate their entry.
+# The short TTL bounds staleness across multiple workers. TTLCache is not
+# thread-safe, so every access holds job_cache_lock (the dev server and
+# the gthread gunicorn workers both run requests on threads).
+job_cache = TTLCache(maxsize=10_000, ttl=60)
+job_cache_lock = threading.Lock()
+
+# Counting stops once this many filtered rows exist; the UI only needs
+# "lots" beyond a point, not an exact figure
+COUNT_CAP = 1001
+
+# Unfiltered totals come from the table statistics, refreshed every 30s
+_table_count_cache = TTLCache(maxsize=1, ttl=30)
+_table_count_lock = threading.Lock()
+
+
+def _estimate_total(filters):
+    """Estimate the listing total without a full COUNT(*) scan.
+
+    With no filters, reads the planner's row estimate from
+    information_schema (cached 30s). With filters, counts a probe capped at
+    COUNT_CAP rows so counting cost stays bounded however many rows match.
+    """
+    if not filters:
+        with _table_count_lock:
+            total = _table_count_cache.get("jobs")
+        if total is None:
+            total = db.session.execute(text(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = 'jobs'"
+            )).scalar() or 0
+            with _table_count_lock:
+                _table_count_cache["jobs"] = total
+        return total
+
+    probe = select(Job.id).where(*filters).limit(COUNT_CAP).subquery()
+    return db.session.execute(select(func.count()).select_from(probe)).scalar()
+
+
+def _iso_default(o):
+    """Stdlib-json fallback rendering datetimes ISO-8601, like orjson."""
+    return o.isoformat()
+
+
+def _json_response(payload, status=200):
+    """Encode `payload` with a single orjson.dumps call.
+
+    Writes the encoded bytes straight into the response, skipping the JSON
+    provider's bytes->str->bytes round-trip on the hot read endpoints.
+    """
+    if orjson is None:
+        return jsonify(payload), status
+    return Response(orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC),
+                    status=status, mimetype="application/json")
+
 
 def get_jobs_controller():
     try:
@@ -15,59 +90,114 @@ def get_jobs_controller():
         page = request.args.get("page", default=1, type=int)
         page_size = request.args.get("page_size", default=10, type=int)
 
+        # Keyset cursor (preferred over page/offset for deep pages)
+        after_posting_date = request.args.get("after_posting_date", type=str)
+        after_id = request.args.get("after_id", type=int)
+
         # Enforce max page size
         if page_size > 100:
             page_size = 100
 
-        # Base query
-        query = Job.query
-
-        # Apply filters
+        # Filters (FULLTEXT index seeks instead of leading-% scans); kept as
+        # a list so the capped count probe can reuse them
+        filters = []
         if search:
-            query = query.filter(
-                (Job.title.ilike(f"%{search}%")) | (Job.company.ilike(f"%{search}%"))
-            )
+            match = Job.search_filter(search)
+            if match is not None:
+                filters.append(match)
         if location:
-            query = query.filter(Job.location.ilike(f"%{location}%"))
+            match = Job.location_filter(location)
+            if match is not None:
+                filters.append(match)
         if job_type:
-            query = query.filter(Job.job_type == job_type)
+            filters.append(Job.job_type == job_type)
         if tag:
-            query = query.filter(Job.tags.ilike(f"%{tag}%"))
-
-        # Sorting
-        if sort == "posting_date_asc":
-            query = query.order_by(Job.posting_date.asc())
-        else:  # default newest first
-            query = query.order_by(Job.posting_date.desc())
-
-        # Pagination
-        total = query.count()
-        jobs = query.offset((page - 1) * page_size).limit(page_size).all()
-
-        # Response
-        job_list = []
-        for job in jobs:
-            job_list.append({
-                "id": job.id,
-                "title": job.title,
-                "company": job.company,
-                "location": job.location,
-                "posting_date": job.posting_date.isoformat() if job.posting_date else None,
-                "posting_date_raw": job.posting_date_raw,
-                "job_type": job.job_type,
-                "tags": job.tags,
-            })
-
-        return jsonify({
+            match = Job.tag_filter(tag)
+            if match is not None:
+                filters.append(match)
+
+        # Base query: Core select of just the serialized columns (no ORM
+        # instance construction)
+        query = select(*JOB_LIST_COLUMNS)
+        if filters:
+            query = query.where(*filters)
+
+        # Sorting (id tie-breaker keeps the order stable for the cursor).
+        # NULL posting dates sort last in either direction so the cursor
+        # can walk through them instead of dropping or stopping at them.
+        ascending = sort == "posting_date_asc"
+        if ascending:
+            # MySQL puts NULLs first under ASC, so moving them last needs
+            # an explicit leading key (this branch filesorts)
+            query = query.order_by(Job.posting_date.is_(None).asc(),
+                                   Job.posting_date.asc(), Job.id.asc())
+        else:  # default newest first; MySQL sorts NULLs last under DESC by
+            # itself, so the ORDER BY stays exactly ix_jobs_posting_date_id
+            # and the planner walks the index
+            query = query.order_by(Job.posting_date.desc(), Job.id.desc())
+
+        # Pagination: seek from the cursor when given, so the DB never
+        # re-reads and discards the rows of earlier pages. A cursor with no
+        # after_posting_date means we are inside the NULL-dated tail.
+        if after_id is not None:
+            if after_posting_date is not None:
+                try:
+                    after_dt = parse_datetime(after_posting_date)
+                except ValueError:
+                    return jsonify({"error": "Validation failed",
+                                    "fields": {"after_posting_date": "must be valid ISO datetime"}}), 400
+                dated = tuple_(Job.posting_date, Job.id)
+                seek = dated > tuple_(after_dt, after_id) if ascending \
+                    else dated < tuple_(after_dt, after_id)
+                query = query.where(or_(
+                    and_(Job.posting_date.isnot(None), seek),
+                    Job.posting_date.is_(None),
+                ))
+            else:
+                query = query.where(
+                    Job.posting_date.is_(None),
+                    Job.id > after_id if ascending else Job.id < after_id,
+                )
+        elif page > 1:
+            # Legacy page/offset access still works without a cursor
+            query = query.offset((page - 1) * page_size)
+
+        rows = db.session.execute(query.limit(page_size)).mappings().all()
+        total = _estimate_total(filters)
+
+        job_list, next_cursor = build_listing(rows, page_size)
+
+        return _json_response({
             "jobs": job_list,
             "total": total,
             "page": page,
             "page_size": page_size,
+            "next_cursor": next_cursor,
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
     
 
+def export_jobs_controller():
+    """Stream every job as newline-delimited JSON.
+
+    Rows are fetched in server-side batches (yield_per) and encoded one at
+    a time, so memory stays constant however many jobs exist.
+    """
+    def generate():
+        result = db.session.execute(
+            select(*JOB_LIST_COLUMNS).execution_options(yield_per=1000)
+        ).mappings()
+        for row in result:
+            if orjson is not None:
+                yield orjson.dumps(dict(row), option=orjson.OPT_NAIVE_UTC) + b"\n"
+            else:
+                yield (json.dumps(dict(row), default=_iso_default) + "\n").encode()
+
+    return Response(stream_with_context(generate()),
+                    mimetype="application/x-ndjson")
+
+
 def create_job_controller():
     data = request.get_json()
 
@@ -86,72 +216,89 @@ def create_job_controller():
     posting_date = None
     if data.get("posting_date"):
         try:
-            posting_date = datetime.fromisoformat(data["posting_date"].replace("Z", "+00:00"))
+            posting_date = parse_datetime(data["posting_date"])
         except ValueError:
             errors["posting_date"] = "must be valid ISO datetime"
 
     # job_type validation
-    allowed_types = ["Full-time", "Part-time", "Contract", "Internship"]
-    if data.get("job_type") and data["job_type"] not in allowed_types:
-        errors["job_type"] = f"must be one of {allowed_types}"
+    if data.get("job_type") and data["job_type"] not in ALLOWED_TYPES:
+        errors["job_type"] = f"must be one of {Job.VALID_JOB_TYPES}"
+
+    # tags validation (each tag must fit the job_tags column)
+    for tag in split_tags(data.get("tags") or ""):
+        if len(tag) > TAG_MAX_LENGTH:
+            errors["tags"] = f"each tag must be {TAG_MAX_LENGTH} characters or less"
+            break
 
     # Return validation errors
     if errors:
         return jsonify({"error": "Validation failed", "fields": errors}), 400
 
-    # Duplicate check (same title + company + location)
-    existing = Job.query.filter_by(
-        title=data["title"],
-        company=data["company"],
-        location=data["location"]
-    ).first()
-
-    if existing:
+    # Core insert: skips ORM instance state tracking for a pure insert.
+    # The uq_job_identity constraint catches duplicates (same title +
+    # company + location) without a pre-check query.
+    values = {
+        "title": data["title"],
+        "company": data["company"],
+        "location": data["location"],
+        "posting_date": posting_date,
+        "posting_date_raw": data.get("posting_date_raw"),
+        "job_type": data.get("job_type"),
+        "tags": data.get("tags"),
+    }
+    try:
+        result = db.session.execute(insert(Job).values(**values))
+        new_id = result.inserted_primary_key[0]
+        tag_rows = [{"job_id": new_id, "tag": tag}
+                    for tag in split_tags(values["tags"])]
+        if tag_rows:
+            db.session.execute(insert(JobTag), tag_rows)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
         return jsonify({"error": "Job already exists"}), 409
-
-    # Create job object
-    new_job = Job(
-        title=data["title"],
-        company=data["company"],
-        location=data["location"],
-        posting_date=posting_date,
-        posting_date_raw=data.get("posting_date_raw"),
-        job_type=data.get("job_type"),
-        tags=data.get("tags")
-    )
-
-    db.session.add(new_job)
-    db.session.commit()
+    except DataError:
+        db.session.rollback()
+        return jsonify({"error": "Validation failed",
+                        "fields": "value too long or out of range"}), 400
 
     # Response
     return jsonify({
-        "id": new_job.id,
-        "title": new_job.title,
-        "company": new_job.company,
-        "posting_date": new_job.posting_date.isoformat() if new_job.posting_date else None,
-        "posting_date_raw": new_job.posting_date_raw,
-        "job_type": new_job.job_type,
-        "tags": new_job.tags
+        "id": new_id,
+        "title": values["title"],
+        "company": values["company"],
+        "posting_date": values["posting_date"],
+        "posting_date_raw": values["posting_date_raw"],
+        "job_type": values["job_type"],
+        "tags": values["tags"]
     }), 201
 
 
 
 def get_specfic_job_controller(job_id):
+    with job_cache_lock:
+        cached = job_cache.get(job_id)
+    if cached is not None:
+        return _json_response(cached)
+
     job = Job.query.get(job_id)  # Fetch by primary key
-    
+
     if not job:
         return jsonify({"error": "Job not found"}), 404
-    
-    return jsonify({
+
+    payload = {
         "id": job.id,
         "title": job.title,
         "company": job.company,
         "location": job.location,
-        "posting_date": job.posting_date.isoformat() if job.posting_date else None,
+        "posting_date": job.posting_date,
         "posting_date_raw": job.posting_date_raw,
         "job_type": job.job_type,
         "tags": job.tags
-    }), 200
+    }
+    with job_cache_lock:
+        job_cache[job_id] = payload
+    return _json_response(payload)
 
 
 
@@ -164,8 +311,6 @@ def update_job_controller(job_id):
     if not data or len(data) == 0:
         return jsonify({"error": "Validation failed", "fields": "At least one field required"}), 400
 
-    # Allowed job types
-    allowed_job_types = ["Full-time", "Part-time", "Contract", "Internship"]
 
     # Update fields if provided
     if "title" in data:
@@ -185,7 +330,7 @@ def update_job_controller(job_id):
 
     if "posting_date" in data:
         try:
-            job.posting_date = datetime.fromisoformat(data["posting_date"].replace("Z", "+00:00"))
+            job.posting_date = parse_datetime(data["posting_date"])
         except Exception:
             return jsonify({"error": "Validation failed", "fields": {"posting_date": "Invalid ISO datetime"}}), 400
 
@@ -193,24 +338,41 @@ def update_job_controller(job_id):
         job.posting_date_raw = data["posting_date_raw"]
 
     if "job_type" in data:
-        if data["job_type"] not in allowed_job_types:
+        if data["job_type"] not in ALLOWED_TYPES:
             return jsonify({"error": "Validation failed", "fields": {"job_type": "Invalid type"}}), 400
         job.job_type = data["job_type"]
 
     if "tags" in data:
+        for tag in split_tags(data["tags"] or ""):
+            if len(tag) > TAG_MAX_LENGTH:
+                return jsonify({"error": "Validation failed",
+                                "fields": {"tags": f"each tag must be {TAG_MAX_LENGTH} characters or less"}}), 400
         job.tags = data["tags"]
+        job.sync_tag_rows()
 
     # Auto update timestamp
     job.updated_at = datetime.utcnow()
 
-    db.session.commit()
+    # Renaming onto an existing (title, company, location) trips
+    # uq_job_identity just like a duplicate create
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "Job already exists"}), 409
+    except DataError:
+        db.session.rollback()
+        return jsonify({"error": "Validation failed",
+                        "fields": "value too long or out of range"}), 400
+    with job_cache_lock:
+        job_cache.pop(job_id, None)
 
     return jsonify({
         "id": job.id,
         "title": job.title,
         "company": job.company,
         "location": job.location,
-        "posting_date": job.posting_date.isoformat() if job.posting_date else None,
+        "posting_date": job.posting_date,
         "posting_date_raw": job.posting_date_raw,
         "job_type": job.job_type,
         "tags": job.tags
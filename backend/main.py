@@ -1,7 +1,13 @@
 
 import os
+from datetime import date, datetime
+try:
+    import orjson
+except ImportError:  # PyPy build runs on stdlib json (no orjson wheels)
+    orjson = None
 # from flask import Flask, jsonify
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 # from config import config
 # from database import init_db
@@ -11,8 +17,48 @@ from routes.jobs import jobs_routes
 from flask_sqlalchemy import SQLAlchemy
 from database import db
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's native encoder.
+
+    Serializes datetimes directly (naive values treated as UTC), so
+    response builders can pass datetime objects without .isoformat().
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class IsoDatetimeProvider(DefaultJSONProvider):
+    """Stdlib-json fallback matching orjson's ISO-8601 datetime rendering.
+
+    Flask's default provider renders datetimes as RFC 1123, which would
+    change the wire format (and break cursor round-trips) on builds
+    without orjson.
+    """
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, (datetime, date)):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+
 app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'mysql+pymysql://root:@localhost/jobboard'
+app.json = OrjsonProvider(app) if orjson is not None else IsoDatetimeProvider(app)
+# mysqlclient (C extension) decodes result rows far faster than PyMySQL;
+# the PyPy image overrides DATABASE_URL to keep the pure-Python driver
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv(
+    'DATABASE_URL', 'mysql+mysqldb://root:@localhost/jobboard')
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 20,            # steady-state connections per worker
+    'max_overflow': 40,         # burst headroom before callers block
+    'pool_pre_ping': True,      # drop connections killed by wait_timeout
+    'pool_recycle': 1800,       # recycle before MySQL's 8h default anyway
+    'pool_use_lifo': True,      # reuse the hottest connections first
+}
 db.init_app(app)
 
 CORS(app)
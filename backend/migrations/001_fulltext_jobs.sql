@@ -0,0 +1,7 @@
+-- FULLTEXT indexes for the /jobs search, location and tag filters.
+-- New databases get these from db.create_all(); run this against
+-- existing databases. MATCH() requires an index whose column list
+-- matches exactly, hence one index per filter.
+ALTER TABLE jobs ADD FULLTEXT INDEX ft_jobs_search (title, company);
+ALTER TABLE jobs ADD FULLTEXT INDEX ft_jobs_location (location);
+ALTER TABLE jobs ADD FULLTEXT INDEX ft_jobs_tags (tags);
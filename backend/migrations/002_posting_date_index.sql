@@ -0,0 +1,4 @@
+-- Composite descending index backing the paginated ORDER BY in /jobs.
+-- New databases get this from db.create_all(); run this against
+-- existing databases. Requires MySQL 8+ for descending indexes.
+ALTER TABLE jobs ADD INDEX ix_jobs_posting_date_id (posting_date DESC, id DESC);
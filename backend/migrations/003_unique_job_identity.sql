@@ -0,0 +1,6 @@
+-- Unique job identity so creates rely on the database instead of a
+-- racy SELECT-then-INSERT pre-check. Deduplicate existing rows first:
+--   DELETE a FROM jobs a JOIN jobs b
+--     ON a.title = b.title AND a.company = b.company
+--    AND a.location = b.location AND a.id > b.id;
+ALTER TABLE jobs ADD CONSTRAINT uq_job_identity UNIQUE (title, company, location);
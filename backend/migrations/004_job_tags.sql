@@ -0,0 +1,31 @@
+-- Normalized job_tags table replacing ilike('%tag%') over the CSV column.
+-- New databases get the table from db.create_all(); run this against
+-- existing databases (MySQL 8+ for the recursive backfill).
+CREATE TABLE job_tags (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    job_id INT NOT NULL,
+    tag VARCHAR(64) NOT NULL,
+    CONSTRAINT fk_job_tags_job FOREIGN KEY (job_id)
+        REFERENCES jobs (id) ON DELETE CASCADE,
+    INDEX ix_job_tags_tag (tag)
+);
+
+-- Backfill from the comma-separated jobs.tags column.
+INSERT INTO job_tags (job_id, tag)
+WITH RECURSIVE split (job_id, tag, rest) AS (
+    SELECT id,
+           TRIM(SUBSTRING_INDEX(tags, ',', 1)),
+           SUBSTRING(tags, LENGTH(SUBSTRING_INDEX(tags, ',', 1)) + 2)
+      FROM jobs
+     WHERE tags IS NOT NULL AND tags <> ''
+    UNION ALL
+    SELECT job_id,
+           TRIM(SUBSTRING_INDEX(rest, ',', 1)),
+           SUBSTRING(rest, LENGTH(SUBSTRING_INDEX(rest, ',', 1)) + 2)
+      FROM split
+     WHERE rest <> ''
+)
+SELECT job_id, tag FROM split WHERE tag <> '';
+
+-- The tag filter no longer uses the tags FULLTEXT index.
+ALTER TABLE jobs DROP INDEX ft_jobs_tags;
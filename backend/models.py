@@ -1,15 +1,86 @@
 """Database models for the job board application."""
 
+import re
+import warnings
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List
-from sqlalchemy import Column, Integer, String, DateTime, Text, func
+from sqlalchemy import (Column, ForeignKey, Index, Integer, String, DateTime,
+                        Text, UniqueConstraint, bindparam, false, func, select,
+                        text)
 from database import db
 
+try:
+    from ciso8601 import parse_datetime
+except ImportError:  # PyPy build parses with the stdlib (no C extensions)
+    def parse_datetime(value: str) -> datetime:
+        """Parse an ISO-8601 string, accepting a trailing Z like ciso8601."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Width of job_tags.tag; individual tags are validated against this so a
+# too-long tag fails validation instead of erroring at insert time
+TAG_MAX_LENGTH = 64
+
+
+@lru_cache(maxsize=4096)
+def _split_tags_cached(tags: str) -> tuple:
+    return tuple(tag for tag in (part.strip() for part in tags.split(',')) if tag)
+
+
+def split_tags(tags: str) -> List[str]:
+    """Split a comma-separated tags string into clean tag names.
+
+    Tags strings repeat heavily across requests, so the split/strip pass is
+    memoized; a fresh list is returned so callers may mutate it.
+    """
+    if not tags:
+        return []
+    return list(_split_tags_cached(tags))
+
+
+def fulltext_match(columns: str, term: str):
+    """Build a boolean-mode MATCH ... AGAINST expression for a FULLTEXT index.
+
+    `columns` must exactly match the column list of one of the FULLTEXT
+    indexes on `jobs`. Each token in `term` is required and prefix-matched
+    (`+token*`), so the index is seeked instead of the table being scanned.
+    Returns None when no term was supplied; a term with no indexable
+    tokens yields an always-false expression, so a filter the caller
+    supplied can only narrow results, never widen them.
+    """
+    if not term:
+        return None
+    tokens = _TOKEN_RE.findall(term)
+    if not tokens:
+        return false()
+
+    query = ' '.join(f'+{token}*' for token in tokens)
+    # Parameter name derives from the first column, so the search, location
+    # and tag filters can coexist in one statement without clashing.
+    name = f'ft_{columns.split(",")[0].strip()}'
+    return text(f"MATCH({columns}) AGAINST(:{name} IN BOOLEAN MODE)").bindparams(
+        bindparam(name, value=query)
+    )
+
 
 class Job(db.Model):
     """Job model representing a job posting."""
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        # A job is identified by (title, company, location); the database
+        # enforces this so creates need no duplicate pre-check query.
+        UniqueConstraint('title', 'company', 'location', name='uq_job_identity'),
+        # FULLTEXT indexes backing fulltext_match(); MATCH() requires an
+        # index whose column list matches exactly, hence one per filter.
+        Index('ft_jobs_search', 'title', 'company', mysql_prefix='FULLTEXT'),
+        Index('ft_jobs_location', 'location', mysql_prefix='FULLTEXT'),
+        # Backs the default ORDER BY posting_date DESC, id DESC page fetch
+        # so the planner walks the index instead of filesorting the table.
+        Index('ix_jobs_posting_date_id', text('posting_date DESC'), text('id DESC')),
+    )
 
     # Valid job types
     VALID_JOB_TYPES = ['Full-time', 'Part-time', 'Contract', 'Internship']
@@ -28,6 +99,10 @@ class Job(db.Model):
     updated_at = Column(DateTime, server_default=func.now(),
                         onupdate=func.now())                       # auto update
 
+    # Normalized tag rows kept in sync with the `tags` CSV (see sync_tag_rows)
+    tag_rows = db.relationship('JobTag', backref='job',
+                               cascade='all, delete-orphan', passive_deletes=True)
+
     def __repr__(self) -> str:
         """String representation of Job."""
         return f'<Job {self.id}: {self.title} at {self.company}>'
@@ -39,7 +114,7 @@ class Job(db.Model):
             'title': self.title,
             'company': self.company,
             'location': self.location,
-            'posting_date': self.posting_date.isoformat() if self.posting_date else None,
+            'posting_date': self.posting_date,
             'posting_date_raw': self.posting_date_raw,
             'job_type': self.job_type,
             'tags': self.tags
@@ -61,12 +136,13 @@ class Job(db.Model):
         if posting_date:
             if isinstance(posting_date, str):
                 try:
-                    job.posting_date = datetime.fromisoformat(posting_date.replace('Z', '+00:00'))
+                    job.posting_date = parse_datetime(posting_date)
                 except ValueError:
                     pass  # Invalid date format, leave as None
             elif isinstance(posting_date, datetime):
                 job.posting_date = posting_date
 
+        job.sync_tag_rows()
         return job
 
     def validate(self) -> Dict[str, List[str]]:
@@ -98,6 +174,13 @@ class Job(db.Model):
         # Tags validation (optional but if provided, should be reasonable)
         if self.tags and len(self.tags) > 1000:
             errors.setdefault('tags', []).append('Tags must be 1000 characters or less')
+        elif self.tags:
+            for tag in self.get_tags_list():
+                if len(tag) > TAG_MAX_LENGTH:
+                    errors.setdefault('tags', []).append(
+                        f'Each tag must be {TAG_MAX_LENGTH} characters or less'
+                    )
+                    break
 
         # Posting date raw validation
         if self.posting_date_raw and len(self.posting_date_raw) > 128:
@@ -113,9 +196,7 @@ class Job(db.Model):
 
     def get_tags_list(self) -> List[str]:
         """Get tags as a list."""
-        if not self.tags:
-            return []
-        return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
+        return split_tags(self.tags)
 
     def set_tags_from_list(self, tags_list: List[str]) -> None:
         """Set tags from a list."""
@@ -125,9 +206,54 @@ class Job(db.Model):
             # Clean and filter tags
             clean_tags = [tag.strip() for tag in tags_list if tag.strip()]
             self.tags = ','.join(clean_tags) if clean_tags else None
+        self.sync_tag_rows()
+
+    @classmethod
+    def search_filter(cls, term: str):
+        """SQL expression matching `term` against title/company.
+
+        Uses the ft_jobs_search FULLTEXT index; a term with no indexable
+        tokens matches nothing.
+        """
+        return fulltext_match('title, company', term)
+
+    @classmethod
+    def location_filter(cls, term: str):
+        """SQL expression matching `term` against location (ft_jobs_location)."""
+        return fulltext_match('location', term)
+
+    @classmethod
+    def tag_filter(cls, tag: str):
+        """SQL expression matching jobs carrying exactly `tag`.
+
+        Seeks the ix_job_tags_tag index on the normalized job_tags table —
+        an exact match, so 'java' no longer matches 'javascript'. Returns
+        None when no tag was supplied; a blank tag matches nothing.
+        """
+        if tag is None:
+            return None
+        tag = tag.strip()
+        if not tag:
+            return false()
+        return cls.id.in_(select(JobTag.job_id).where(JobTag.tag == tag))
+
+    def sync_tag_rows(self) -> None:
+        """Rebuild the normalized job_tags rows from the `tags` CSV.
+
+        Must be called whenever `tags` is written so tag_filter keeps
+        seeing current data.
+        """
+        self.tag_rows = [JobTag(tag=tag) for tag in self.get_tags_list()]
 
     def matches_search(self, search_term: str) -> bool:
-        """Check if job matches search term in title or company."""
+        """Deprecated: filter in SQL with Job.search_filter() instead.
+
+        Calling this in a loop over query results re-filters rows in Python
+        after the database already returned them (the N+1 pattern).
+        """
+        warnings.warn(
+            'Job.matches_search is deprecated; filter the query with '
+            'Job.search_filter() instead', DeprecationWarning, stacklevel=2)
         if not search_term:
             return True
 
@@ -138,16 +264,44 @@ class Job(db.Model):
         )
 
     def matches_location(self, location_term: str) -> bool:
-        """Check if job matches location term."""
+        """Deprecated: filter in SQL with Job.location_filter() instead."""
+        warnings.warn(
+            'Job.matches_location is deprecated; filter the query with '
+            'Job.location_filter() instead', DeprecationWarning, stacklevel=2)
         if not location_term:
             return True
 
         return location_term.lower() in self.location.lower()
 
     def has_tag(self, tag: str) -> bool:
-        """Check if job has a specific tag."""
+        """Deprecated: filter in SQL with Job.tag_filter() instead."""
+        warnings.warn(
+            'Job.has_tag is deprecated; filter the query with '
+            'Job.tag_filter() instead', DeprecationWarning, stacklevel=2)
         if not tag or not self.tags:
             return False
 
         tags_list = self.get_tags_list()
         return tag.lower() in [t.lower() for t in tags_list]
+
+
+class JobTag(db.Model):
+    """Normalized tag row: one (job_id, tag) pair per tag on a job.
+
+    Replaces ilike('%tag%') over the CSV column with an indexed equality
+    lookup (and fixes the 'java' vs 'javascript' false positive).
+    """
+
+    __tablename__ = 'job_tags'
+    __table_args__ = (
+        Index('ix_job_tags_tag', 'tag'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey('jobs.id', ondelete='CASCADE'),
+                    nullable=False)
+    tag = Column(String(TAG_MAX_LENGTH), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of JobTag."""
+        return f'<JobTag {self.tag} on job {self.job_id}>'
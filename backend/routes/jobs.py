@@ -1,7 +1,6 @@
-from datetime import datetime
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify
 from models import Job
-from controllers.job_controller import create_job_controller, get_jobs_controller, get_specfic_job_controller, update_job_controller
+from controllers.job_controller import create_job_controller, export_jobs_controller, get_jobs_controller, get_specfic_job_controller, job_cache, job_cache_lock, update_job_controller
 from database import db
 
 jobs_routes = Blueprint('jobs_routes', __name__)
@@ -10,6 +9,10 @@ jobs_routes = Blueprint('jobs_routes', __name__)
 def get_jobs():
     return get_jobs_controller()
 
+@jobs_routes.route('/jobs/export', methods=['GET'])
+def export_jobs():
+    return export_jobs_controller()
+
 @jobs_routes.route("/jobs/add", methods=["POST"])
 def create_job():
     return create_job_controller()
@@ -30,5 +33,7 @@ def delete_job(job_id):
 
     db.session.delete(job)
     db.session.commit()
+    with job_cache_lock:
+        job_cache.pop(job_id, None)
 
     return jsonify({"message": "Job deleted successfully"}), 200 
@@ -1,8 +1,9 @@
 """Job service layer containing business logic for job operations."""
 
 from typing import Dict, List, Any, Optional, Tuple
-from sqlalchemy import and_, or_, desc, asc
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import load_only
 from database import db
 from models import Job
 
@@ -27,35 +28,39 @@ class JobService:
             Tuple of (jobs_list, total_count)
         """
         try:
-            # Start with base query
-            query = Job.query
+            # Start with base query; the window count shares one scan with
+            # the page fetch instead of a separate COUNT round-trip, and
+            # load_only projects just the columns to_dict() serializes
+            query = db.session.query(Job, func.count().over().label('total')).options(
+                load_only(Job.id, Job.title, Job.company, Job.location,
+                          Job.posting_date, Job.posting_date_raw, Job.job_type, Job.tags)
+            )
 
             # Apply filters
             filters = []
             
             if search:
-                search_filter = or_(
-                    Job.title.ilike(f'%{search}%'),
-                    Job.company.ilike(f'%{search}%')
-                )
-                filters.append(search_filter)
-            
+                search_filter = Job.search_filter(search)
+                if search_filter is not None:
+                    filters.append(search_filter)
+
             if location:
-                filters.append(Job.location.ilike(f'%{location}%'))
-            
+                location_filter = Job.location_filter(location)
+                if location_filter is not None:
+                    filters.append(location_filter)
+
             if job_type:
                 filters.append(Job.job_type == job_type)
-            
+
             if tag:
                 # Search for tag in comma-separated tags
-                filters.append(Job.tags.ilike(f'%{tag}%'))
+                tag_filter = Job.tag_filter(tag)
+                if tag_filter is not None:
+                    filters.append(tag_filter)
             
             if filters:
                 query = query.filter(and_(*filters))
 
-            # Get total count before pagination
-            total_count = query.count()
-
             # Apply sorting
             if sort == 'posting_date_asc':
                 query = query.order_by(asc(Job.posting_date))
@@ -64,10 +69,11 @@ class JobService:
 
             # Apply pagination
             offset = (page - 1) * page_size
-            jobs = query.offset(offset).limit(page_size).all()
+            rows = query.offset(offset).limit(page_size).all()
+            total_count = rows[0].total if rows else 0
 
             # Convert to dictionaries
-            jobs_list = [job.to_dict() for job in jobs]
+            jobs_list = [job.to_dict() for job, _ in rows]
 
             return jobs_list, total_count
 
@@ -100,20 +106,15 @@ class JobService:
             if validation_errors:
                 return None, validation_errors
 
-            # Check for duplicates (same title, company, location)
-            existing_job = Job.query.filter_by(
-                title=job.title.strip(),
-                company=job.company.strip(),
-                location=job.location.strip()
-            ).first()
-            
-            if existing_job:
+            # Save to database; the uq_job_identity constraint rejects
+            # duplicates (same title, company, location) without a pre-check
+            db.session.add(job)
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
                 return None, {'duplicate': ['Job already exists']}
 
-            # Save to database
-            db.session.add(job)
-            db.session.commit()
-            
             return job.to_dict(), None
 
         except SQLAlchemyError as e:
@@ -145,8 +146,8 @@ class JobService:
                 posting_date = job_data['posting_date']
                 if isinstance(posting_date, str):
                     try:
-                        from datetime import datetime
-                        job.posting_date = datetime.fromisoformat(posting_date.replace('Z', '+00:00'))
+                        from models import parse_datetime
+                        job.posting_date = parse_datetime(posting_date)
                     except ValueError:
                         pass  # Invalid date format, leave unchanged
                 elif posting_date is not None:
@@ -157,15 +158,21 @@ class JobService:
                 job.job_type = job_data['job_type']
             if 'tags' in job_data:
                 job.tags = job_data['tags']
+                job.sync_tag_rows()
 
             # Validate updated job data
             validation_errors = job.validate()
             if validation_errors:
                 return None, validation_errors
 
-            # Save changes
-            db.session.commit()
-            
+            # Save changes; renaming onto an existing (title, company,
+            # location) trips uq_job_identity just like a duplicate create
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                return None, {'duplicate': ['Job already exists']}
+
             return job.to_dict(), None
 
         except SQLAlchemyError as e:
@@ -209,7 +216,10 @@ class JobService:
     def search_jobs_by_tag(tag: str) -> List[Dict[str, Any]]:
         """Search jobs by a specific tag."""
         try:
-            jobs = Job.query.filter(Job.tags.ilike(f'%{tag}%')).all()
+            match = Job.tag_filter(tag)
+            if match is None:
+                return []
+            jobs = Job.query.filter(match).all()
             return [job.to_dict() for job in jobs]
         except SQLAlchemyError as e:
             raise Exception(f"Database error while searching jobs by tag: {str(e)}")